@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
 from string import Template
-from textwrap import dedent
-from typing import Literal, Mapping, Sequence
+from types import MappingProxyType
+from typing import Literal, Mapping, Optional, Sequence
 
+import plotly.express as px
 import plotly.graph_objects as go
 import plotly.io as pio
 import streamlit as st
 
 
+@lru_cache(maxsize=128)
+def _with_alpha(hex6: str, alpha_hex: str) -> str:
+    """Append an alpha channel to a ``#RRGGBB`` colour, sharing results across themes."""
+
+    return f"{hex6}{alpha_hex}"
+
+
 @dataclass(frozen=True)
 class BrandTheme:
     """Brand system for the RevOps Control Center UI."""
@@ -41,17 +52,148 @@ class BrandTheme:
         "#34D399",
         "#F97316",
     )
+    # Plotly expects a list; built once per theme in ``__post_init__`` and shared read-only.
+    colorway_list: list[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Themes repeat many colour and font values; intern them so instances share one copy.
+        for theme_field in fields(self):
+            if not theme_field.init:
+                continue
+            value = getattr(self, theme_field.name)
+            if isinstance(value, str):
+                object.__setattr__(self, theme_field.name, sys.intern(value))
+        colorway = tuple(sys.intern(colour) for colour in self.colorway)
+        object.__setattr__(self, "colorway", colorway)
+        object.__setattr__(self, "colorway_list", list(colorway))
+
+    @cached_property
+    def accent_primary1f(self) -> str:
+        return _with_alpha(self.accent_primary, "1f")
+
+    @cached_property
+    def accent_secondary1f(self) -> str:
+        return _with_alpha(self.accent_secondary, "1f")
+
+    @cached_property
+    def accent_primary26(self) -> str:
+        return _with_alpha(self.accent_primary, "26")
+
+    @cached_property
+    def accent_secondary26(self) -> str:
+        return _with_alpha(self.accent_secondary, "26")
+
+    @cached_property
+    def accent_primarycc(self) -> str:
+        return _with_alpha(self.accent_primary, "cc")
+
+    @cached_property
+    def accent_secondarycc(self) -> str:
+        return _with_alpha(self.accent_secondary, "cc")
+
+    @cached_property
+    def surface_tokens(self) -> Mapping[str, str]:
+        """Derived CSS token values, computed once per theme instance."""
+
+        if self.base == "dark":
+            return {
+                "sidebar_panel_bg": "rgba(15, 23, 42, 0.68)",
+                "control_surface": "rgba(15, 23, 42, 0.78)",
+                "control_hover": "rgba(99, 102, 241, 0.22)",
+                "control_border": "rgba(99, 102, 241, 0.32)",
+                "sidebar_backdrop": self.sidebar_background,
+                "card_surface": self.surface_color,
+                "card_border": self.surface_border,
+                "chart_surface": self.surface_color,
+                "chart_border": self.surface_border,
+                "metric_value_color": self.accent_secondary,
+                "table_header_bg": "rgba(99, 102, 241, 0.22)",
+                "table_row_border": "rgba(148, 163, 184, 0.22)",
+                "toggle_track_inactive": "rgba(15, 23, 42, 0.78)",
+                "toggle_glint": self.accent_secondary,
+            }
+
+        return {
+            "sidebar_panel_bg": "rgba(255, 255, 255, 0.96)",
+            "control_surface": "rgba(255, 255, 255, 0.94)",
+            "control_hover": "rgba(37, 99, 235, 0.12)",
+            "control_border": "rgba(203, 213, 225, 0.75)",
+            "sidebar_backdrop": self.sidebar_background,
+            "card_surface": self.surface_color,
+            "card_border": self.surface_border,
+            "chart_surface": "rgba(248, 250, 255, 0.96)",
+            "chart_border": self.surface_border,
+            "metric_value_color": self.accent_primary,
+            "table_header_bg": "rgba(226, 232, 240, 0.65)",
+            "table_row_border": "rgba(226, 232, 240, 0.7)",
+            "toggle_track_inactive": "rgba(226, 232, 240, 0.85)",
+            "toggle_glint": self.accent_secondary,
+        }
+
+    @cached_property
+    def substitution_map(self) -> Mapping[str, str]:
+        """Placeholder values for the global stylesheet template."""
+
+        declarations = "\n".join(f"    --{name}: {value};" for name, value in _css_variables(self).items())
+        return {
+            "color_scheme": self.base,
+            "root_block": f":root {{\n    color-scheme: {self.base};\n{declarations}\n}}",
+            "static_css": _STATIC_CSS,
+            "mode_specific_rules": _MODE_RULES[self.base],
+        }
+
+    @cached_property
+    def plotly_layout(self) -> Mapping[str, object]:
+        """Plotly layout defaults for the theme's registered template."""
+
+        axis_style = {
+            "gridcolor": self.surface_border,
+            "linecolor": self.surface_border,
+            "zerolinecolor": self.surface_border,
+            "title": {"font": {"color": self.muted_text}},
+            "tickfont": {"color": self.muted_text},
+            "ticks": "outside",
+            "automargin": True,
+        }
+
+        return {
+            "font": {"family": self.font_family, "color": self.text_color},
+            "paper_bgcolor": self.surface_color,
+            "plot_bgcolor": self.surface_color,
+            "colorway": self.colorway_list,
+            "margin": {"l": 48, "r": 32, "t": 60, "b": 40},
+            "xaxis": axis_style,
+            "yaxis": axis_style,
+            "legend": {
+                "bgcolor": self.surface_color,
+                "bordercolor": self.surface_border,
+                "borderwidth": 1,
+                "font": {"color": self.muted_text},
+                "orientation": "h",
+                "x": 0,
+                "y": -0.15,
+            },
+            "hoverlabel": {
+                "bgcolor": self.surface_color,
+                "bordercolor": self.surface_border,
+                "font": {"color": self.text_color, "family": self.font_family},
+            },
+            "title": {
+                "font": {"size": 22, "family": self.font_family, "color": self.text_color},
+            },
+            "bargap": 0.18,
+            "bargroupgap": 0.12,
+        }
+
 
 DARK_THEME = BrandTheme(
     key="dark",
-    base="dark",
     gradient_background="linear-gradient(150deg, #0B1220 0%, #111C2E 52%, #1C273A 100%)",
     sidebar_background="rgba(11, 17, 30, 0.82)",
     surface_color="rgba(18, 25, 39, 0.72)",
     surface_border="rgba(100, 116, 139, 0.28)",
     overlay_shadow="0px 28px 60px rgba(8, 12, 22, 0.55)",
     text_color="#E5E7EB",
-    muted_text="#94A3B8",
     accent_primary="#4F46E5",
     accent_secondary="#38BDF8",
     accent_tertiary="#8B5CF6",
@@ -98,10 +240,14 @@ LIGHT_THEME = BrandTheme(
 )
 
 
-AVAILABLE_THEMES: Mapping[str, BrandTheme] = {
-    "Dark Mode": DARK_THEME,
-    "Light Mode": LIGHT_THEME,
-}
+# Read-only so theme identity stays pinned: the CSS and Plotly caches below are built
+# from these instances at import and are never invalidated.
+AVAILABLE_THEMES: Mapping[str, BrandTheme] = MappingProxyType(
+    {
+        "Dark Mode": DARK_THEME,
+        "Light Mode": LIGHT_THEME,
+    }
+)
 
 DEFAULT_THEME_NAME = "Dark Mode"
 
@@ -113,1097 +259,990 @@ DEFAULT_PLOTLY_CONFIG: Mapping[str, object] = {
 }
 
 
-def _surface_tokens(theme: BrandTheme) -> Mapping[str, str]:
-    """Return derived CSS token values for the active theme."""
-
-    if theme.base == "dark":
-        return {
-            "sidebar_panel_bg": "rgba(15, 23, 42, 0.68)",
-            "control_surface": "rgba(15, 23, 42, 0.78)",
-            "control_hover": "rgba(99, 102, 241, 0.22)",
-            "control_border": "rgba(99, 102, 241, 0.32)",
-            "sidebar_backdrop": theme.sidebar_background,
-            "card_surface": theme.surface_color,
-            "card_border": theme.surface_border,
-            "chart_surface": theme.surface_color,
-            "chart_border": theme.surface_border,
-            "metric_value_color": theme.accent_secondary,
-            "table_header_bg": "rgba(99, 102, 241, 0.22)",
-            "table_row_border": "rgba(148, 163, 184, 0.22)",
-            "toggle_track_inactive": "rgba(15, 23, 42, 0.78)",
-            "toggle_glint": theme.accent_secondary,
-        }
+def _css_variables(theme: BrandTheme) -> Mapping[str, str]:
+    """Return the CSS custom properties declared on ``:root`` for the theme."""
 
+    tokens = theme.surface_tokens
     return {
-        "sidebar_panel_bg": "rgba(255, 255, 255, 0.96)",
-        "control_surface": "rgba(255, 255, 255, 0.94)",
-        "control_hover": "rgba(37, 99, 235, 0.12)",
-        "control_border": "rgba(203, 213, 225, 0.75)",
-        "sidebar_backdrop": theme.sidebar_background,
-        "card_surface": theme.surface_color,
-        "card_border": theme.surface_border,
-        "chart_surface": "rgba(248, 250, 255, 0.96)",
-        "chart_border": theme.surface_border,
-        "metric_value_color": theme.accent_primary,
-        "table_header_bg": "rgba(226, 232, 240, 0.65)",
-        "table_row_border": "rgba(226, 232, 240, 0.7)",
-        "toggle_track_inactive": "rgba(226, 232, 240, 0.85)",
-        "toggle_glint": theme.accent_secondary,
+        "brand-font": theme.font_family,
+        "brand-gradient": theme.gradient_background,
+        "brand-surface": theme.surface_color,
+        "brand-border": theme.surface_border,
+        "brand-radius": theme.border_radius,
+        "brand-shadow": theme.overlay_shadow,
+        "brand-text": theme.text_color,
+        "brand-muted": theme.muted_text,
+        "brand-accent": theme.accent_primary,
+        "brand-accent-secondary": theme.accent_secondary,
+        "brand-accent-tertiary": theme.accent_tertiary,
+        "brand-accent-faint": theme.accent_primary1f,
+        "brand-accent-secondary-faint": theme.accent_secondary1f,
+        "brand-accent-soft": theme.accent_primary26,
+        "brand-accent-secondary-soft": theme.accent_secondary26,
+        "brand-accent-strong": theme.accent_primarycc,
+        "brand-accent-secondary-strong": theme.accent_secondarycc,
+        "sidebar-panel-bg": tokens["sidebar_panel_bg"],
+        "sidebar-control-bg": tokens["control_surface"],
+        "sidebar-control-hover": tokens["control_hover"],
+        "sidebar-control-border": tokens["control_border"],
+        "sidebar-background": tokens["sidebar_backdrop"],
+        "card-surface": tokens["card_surface"],
+        "card-border": tokens["card_border"],
+        "chart-surface": tokens["chart_surface"],
+        "chart-border": tokens["chart_border"],
+        "metric-value": tokens["metric_value_color"],
+        "table-header-bg": tokens["table_header_bg"],
+        "table-border": tokens["table_row_border"],
+        "toggle-track-active": f"linear-gradient(135deg, {theme.accent_primary}, {theme.accent_secondary})",
+        "toggle-track-inactive": tokens["toggle_track_inactive"],
+        "toggle-thumb-glint": tokens["toggle_glint"],
     }
 
 
-def register_plotly_template(theme: BrandTheme) -> str:
-    """Register and return the Plotly template name for the provided theme."""
+# Theme-independent rules; every themed value resolves through the ``:root`` custom properties.
+_STATIC_CSS = """
+:root {
+    --hero-pad: 2.2rem 2.4rem;
+    --hero-title-size: 2.3rem;
+    --hero-subtitle-size: 1.02rem;
+    --insight-message-size: 1.02rem;
+    --dataframe-pad: 0.65rem 0.55rem 0.5rem;
+    --block-pad: 2rem 1.8rem;
+    --sidebar-w: 260px;
+}
 
-    template_name = f"revops-{theme.key}"
+html, body, [class*="css"] {
+    font-family: var(--brand-font);
+}
 
-    axis_style = {
-        "gridcolor": theme.surface_border,
-        "linecolor": theme.surface_border,
-        "zerolinecolor": theme.surface_border,
-        "title": {"font": {"color": theme.muted_text}},
-        "tickfont": {"color": theme.muted_text},
-        "ticks": "outside",
-        "automargin": True,
-    }
+body {
+    color: var(--brand-text);
+    background: var(--brand-gradient) !important;
+}
 
-    layout = {
-        "font": {"family": theme.font_family, "color": theme.text_color},
-        "paper_bgcolor": theme.surface_color,
-        "plot_bgcolor": theme.surface_color,
-        "colorway": list(theme.colorway),
-        "margin": {"l": 48, "r": 32, "t": 60, "b": 40},
-        "xaxis": axis_style,
-        "yaxis": axis_style,
-        "legend": {
-            "bgcolor": theme.surface_color,
-            "bordercolor": theme.surface_border,
-            "borderwidth": 1,
-            "font": {"color": theme.muted_text},
-            "orientation": "h",
-            "x": 0,
-            "y": -0.15,
-        },
-        "hoverlabel": {
-            "bgcolor": theme.surface_color,
-            "bordercolor": theme.surface_border,
-            "font": {"color": theme.text_color, "family": theme.font_family},
-        },
-        "title": {
-            "font": {"size": 22, "family": theme.font_family, "color": theme.text_color},
-        },
-        "bargap": 0.18,
-        "bargroupgap": 0.12,
-    }
+div[data-testid="stAppViewContainer"] {
+    background: var(--brand-gradient);
+    color: var(--brand-text);
+}
 
-    pio.templates[template_name] = go.layout.Template(layout=layout)
-    return template_name
+header[data-testid="stHeader"] {
+    background: transparent;
+}
 
+section[data-testid="stSidebar"] {
+    background: var(--sidebar-background);
+    backdrop-filter: blur(22px);
+    border-right: 1px solid var(--brand-border);
+}
 
-def apply_plotly_theme(theme: BrandTheme) -> None:
-    """Apply the project-wide Plotly defaults."""
+section[data-testid="stSidebar"] .block-container {
+    background: var(--sidebar-panel-bg);
+    border-radius: calc(var(--brand-radius) - 6px);
+    padding: 1.2rem 1.05rem 1.6rem;
+    border: 1px solid var(--brand-border);
+    box-shadow: var(--brand-shadow);
+    backdrop-filter: blur(18px);
+}
 
-    from plotly import express as px
+section[data-testid="stSidebar"] .block-container > *:not(:last-child) {
+    margin-bottom: 0.85rem;
+}
 
-    template_name = register_plotly_template(theme)
-    setattr(px.defaults, "template", template_name)
-    setattr(px.defaults, "color_discrete_sequence", list(theme.colorway))
+section[data-testid="stSidebar"] *,
+div[data-testid="stSelectbox"] input,
+div[data-testid="stMultiSelect"] input,
+div[data-testid="stDateInput"] input,
+div[data-baseweb="popover"] input {
+    color: var(--brand-text) !important;
+}
 
+section[data-testid="stSidebar"] .stMarkdown,
+section[data-testid="stSidebar"] .stMarkdown p {
+    color: var(--brand-muted) !important;
+}
 
-def inject_global_styles(theme: BrandTheme) -> None:
-    """Inject global CSS overrides for a modern, AI SaaS aesthetic."""
-
-    tokens = _surface_tokens(theme)
-    accent_primary1f = f"{theme.accent_primary}1f"
-    accent_secondary1f = f"{theme.accent_secondary}1f"
-    accent_primarycc = f"{theme.accent_primary}cc"
-    accent_secondarycc = f"{theme.accent_secondary}cc"
-    accent_primary26 = f"{theme.accent_primary}26"
-    accent_secondary26 = f"{theme.accent_secondary}26"
-
-    mode_specific_rules = ""
-    if theme.base == "light":
-        light_surface = tokens["card_surface"]
-        light_border = tokens["card_border"]
-        chart_surface = tokens["chart_surface"]
-        chart_border = tokens["chart_border"]
-        sidebar_panel = tokens["sidebar_panel_bg"]
-        sidebar_background = tokens["sidebar_backdrop"]
-        table_header_bg = tokens["table_header_bg"]
-        table_border = tokens["table_row_border"]
-        control_surface = tokens["control_surface"]
-        control_border = tokens["control_border"]
-        control_hover = tokens["control_hover"]
-        metric_value_color = tokens["metric_value_color"]
-        mode_specific_rules = dedent(
-            f"""
-            body[data-theme-mode="light"],
-            body[data-theme-mode="light"] div[data-testid="stAppViewContainer"] {{
-                background: {theme.gradient_background};
-                color: {theme.text_color};
-            }}
-
-            body[data-theme-mode="light"] ::selection {{
-                background: {accent_primary26};
-                color: {theme.text_color};
-            }}
-
-            body[data-theme-mode="light"] header[data-testid="stHeader"] {{
-                background: transparent;
-            }}
-
-            body[data-theme-mode="light"] section[data-testid="stSidebar"] {{
-                background: {sidebar_background};
-                border-right: 1px solid {light_border};
-                backdrop-filter: blur(22px);
-                box-shadow: none;
-            }}
-
-            body[data-theme-mode="light"] section[data-testid="stSidebar"] .block-container {{
-                background: {sidebar_panel};
-                border: 1px solid {light_border};
-                border-radius: calc({theme.border_radius} - 6px);
-                box-shadow: {theme.overlay_shadow};
-            }}
-
-            body[data-theme-mode="light"] section[data-testid="stSidebar"] * {{
-                color: {theme.text_color} !important;
-            }}
-
-            body[data-theme-mode="light"] section[data-testid="stSidebar"] .stMarkdown,
-            body[data-theme-mode="light"] section[data-testid="stSidebar"] .stMarkdown p {{
-                color: {theme.muted_text} !important;
-            }}
-
-            body[data-theme-mode="light"] .theme-toggle > div[role="radiogroup"] {{
-                background: {control_surface};
-                border: 1px solid {control_border};
-            }}
-
-            body[data-theme-mode="light"] .theme-toggle [role="radio"] {{
-                color: {theme.muted_text};
-            }}
-
-            body[data-theme-mode="light"] .theme-toggle [role="radio"][aria-checked="true"] {{
-                color: {theme.text_color};
-                box-shadow: 0 10px 26px rgba(37, 99, 235, 0.24);
-            }}
-
-            body[data-theme-mode="light"] .stTabs [data-baseweb="tab-list"] {{
-                border-color: {light_border};
-            }}
-
-            body[data-theme-mode="light"] .stTabs [data-baseweb="tab"] {{
-                background: {light_surface} !important;
-                border-color: {light_border} !important;
-                color: {theme.muted_text} !important;
-                box-shadow: none !important;
-            }}
-
-            body[data-theme-mode="light"] .stTabs [aria-selected="true"] {{
-                color: {theme.text_color} !important;
-                box-shadow: 0 14px 32px rgba(37, 99, 235, 0.22);
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stMetric"] {{
-                background: {light_surface};
-                border: 1px solid {light_border};
-                box-shadow: {theme.overlay_shadow};
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stMetricValue"] {{
-                color: {metric_value_color};
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stMetricLabel"] {{
-                color: {theme.muted_text} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stPlotlyChart"] {{
-                background: {light_surface} !important;
-                border: 1px solid {chart_border} !important;
-                box-shadow: {theme.overlay_shadow};
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stPlotlyChart"] .plotly .bg,
-            body[data-theme-mode="light"] div[data-testid="stPlotlyChart"] .plotly .cartesianlayer .bg,
-            body[data-theme-mode="light"] div[data-testid="stPlotlyChart"] .plotly .legend rect,
-            body[data-theme-mode="light"] div[data-testid="stPlotlyChart"] .plotly .legend path {{
-                fill: {chart_surface} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stPlotlyChart"] .plotly text {{
-                fill: {theme.text_color} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stPlotlyChart"] .hoverlayer text {{
-                fill: {theme.text_color} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stSelectbox"] > div,
-            body[data-theme-mode="light"] div[data-testid="stMultiSelect"] > div,
-            body[data-theme-mode="light"] div[data-testid="stDateInput"] > div {{
-                background: {light_surface} !important;
-                border: 1px solid {light_border} !important;
-                box-shadow: none !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stSelectbox"] label,
-            body[data-theme-mode="light"] div[data-testid="stMultiSelect"] label,
-            body[data-theme-mode="light"] div[data-testid="stDateInput"] label {{
-                color: {theme.muted_text} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-baseweb="select"],
-            body[data-theme-mode="light"] div[data-baseweb="input"],
-            body[data-theme-mode="light"] div[data-baseweb="datepicker"] {{
-                background: {light_surface} !important;
-                border: 1px solid {light_border} !important;
-                border-radius: 12px !important;
-                box-shadow: none !important;
-                color: {theme.text_color} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-baseweb="select"] input,
-            body[data-theme-mode="light"] div[data-baseweb="input"] input,
-            body[data-theme-mode="light"] div[data-baseweb="datepicker"] input {{
-                color: {theme.text_color} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-baseweb="popover"] {{
-                background: {light_surface} !important;
-                border: 1px solid {light_border} !important;
-                box-shadow: {theme.overlay_shadow} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-baseweb="popover"] li,
-            body[data-theme-mode="light"] div[data-baseweb="popover"] input {{
-                color: {theme.text_color} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-baseweb="popover"] li:hover,
-            body[data-theme-mode="light"] div[data-baseweb="popover"] li[data-baseweb="option"]:hover {{
-                background: {control_hover} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-baseweb="tag"] {{
-                background: linear-gradient(135deg, {theme.accent_primary}, {theme.accent_secondary}) !important;
-                color: #f8fafc !important;
-                border: none !important;
-                box-shadow: 0 12px 24px rgba(37, 99, 235, 0.2) !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-baseweb="tag"] span,
-            body[data-theme-mode="light"] div[data-baseweb="tag"] svg path,
-            body[data-theme-mode="light"] div[data-baseweb="tag"] svg polygon {{
-                fill: #f8fafc !important;
-                color: #f8fafc !important;
-            }}
-
-            body[data-theme-mode="light"] button[kind="primary"],
-            body[data-theme-mode="light"] div[data-testid="stFormSubmitButton"] button {{
-                background: linear-gradient(135deg, {theme.accent_primary}, {theme.accent_secondary});
-                box-shadow: 0 16px 32px rgba(37, 99, 235, 0.28);
-                border: 1px solid transparent;
-            }}
-
-            body[data-theme-mode="light"] button[kind="secondary"] {{
-                background: {light_surface} !important;
-                border: 1px solid {light_border} !important;
-                color: {theme.muted_text} !important;
-                box-shadow: none !important;
-            }}
-
-            body[data-theme-mode="light"] button[kind="secondary"]:hover,
-            body[data-theme-mode="light"] button[kind="secondary"][aria-pressed="true"] {{
-                color: {theme.text_color} !important;
-                border-color: {theme.accent_primary} !important;
-                box-shadow: 0 10px 20px rgba(37, 99, 235, 0.18) !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stDataFrame"] {{
-                background: {light_surface};
-                border: 1px solid {light_border};
-                box-shadow: {theme.overlay_shadow};
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stDataFrame"] table {{
-                color: {theme.text_color};
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stDataFrame"] thead tr {{
-                background: {table_header_bg} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stDataFrame"] tbody td {{
-                border-color: {table_border} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stDataFrame"] tbody tr:nth-child(even) {{
-                background: rgba(148, 163, 184, 0.12);
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stDataFrame"] tbody tr:hover {{
-                background: {control_hover};
-            }}
-
-            body[data-theme-mode="light"] .marketing-table__card {{
-                background: {light_surface};
-                border: 1px solid {light_border};
-                box-shadow: {theme.overlay_shadow};
-            }}
-
-            body[data-theme-mode="light"] .marketing-table tbody tr:nth-child(even) {{
-                background: rgba(148, 163, 184, 0.12);
-            }}
-
-            body[data-theme-mode="light"] .marketing-table tbody tr:hover {{
-                background: {control_hover};
-            }}
-
-            body[data-theme-mode="light"] .insight-card {{
-                background: {light_surface};
-                border: 1px solid {light_border};
-                box-shadow: {theme.overlay_shadow};
-            }}
-
-            body[data-theme-mode="light"] .insight-chip {{
-                color: {theme.accent_secondary};
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stMarkdown"] h1,
-            body[data-theme-mode="light"] div[data-testid="stMarkdown"] h2,
-            body[data-theme-mode="light"] div[data-testid="stMarkdown"] h3,
-            body[data-theme-mode="light"] .stMarkdown h1,
-            body[data-theme-mode="light"] .stMarkdown h2,
-            body[data-theme-mode="light"] .stMarkdown h3 {{
-                color: {theme.text_color};
-            }}
-
-            body[data-theme-mode="light"] .stDivider {{
-                border-top: 1px solid {light_border} !important;
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stProgressBar"] {{
-                background: linear-gradient(90deg, {accent_primary26}, {accent_secondary26});
-            }}
-
-            body[data-theme-mode="light"] div[data-testid="stProgressBar"] > div {{
-                background: linear-gradient(135deg, {theme.accent_primary}, {theme.accent_secondary});
-            }}
-            """
-        ).strip()
-
-    template = Template(
-        """
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Plus+Jakarta+Sans:wght@500;600&display=swap');
-
-            :root {
-                color-scheme: $color_scheme;
-                --brand-surface: $surface_color;
-                --brand-border: $surface_border;
-                --brand-radius: $border_radius;
-                --brand-shadow: $overlay_shadow;
-                --brand-text: $text_color;
-                --brand-muted: $muted_text;
-                --brand-accent: $accent_primary;
-                --brand-accent-secondary: $accent_secondary;
-                --brand-accent-tertiary: $accent_tertiary;
-                --sidebar-panel-bg: $sidebar_panel_bg;
-                --sidebar-control-bg: $control_surface;
-                --sidebar-control-hover: $control_hover;
-                --sidebar-control-border: $control_border;
-                --sidebar-background: $sidebar_backdrop;
-                --card-surface: $card_surface;
-                --card-border: $card_border;
-                --chart-surface: $chart_surface;
-                --chart-border: $chart_border;
-                --metric-value: $metric_value_color;
-                --table-header-bg: $table_header_bg;
-                --table-border: $table_row_border;
-                --toggle-track-active: linear-gradient(135deg, $accent_primary, $accent_secondary);
-                --toggle-track-inactive: $toggle_track_inactive;
-                --toggle-thumb-glint: $toggle_glint;
-            }
+.theme-toggle {
+    margin: 0.6rem 0 0.4rem;
+}
 
-            html, body, [class*="css"] {
-                font-family: $font_family;
-            }
+.theme-toggle::before {
+    content: "Color mode";
+    display: block;
+    font-size: 0.68rem;
+    letter-spacing: 0.2em;
+    text-transform: uppercase;
+    font-weight: 600;
+    color: var(--brand-muted);
+    margin-bottom: 0.45rem;
+}
 
-            body {
-                color: $text_color;
-                background: $gradient_background !important;
-            }
+.theme-toggle > div[role="radiogroup"] {
+    display: flex;
+    gap: 0.35rem;
+    background: var(--sidebar-control-bg);
+    border: 1px solid var(--sidebar-control-border);
+    border-radius: 999px;
+    padding: 0.25rem;
+}
 
-            div[data-testid="stAppViewContainer"] {
-                background: $gradient_background;
-                color: $text_color;
-            }
+.theme-toggle [role="radio"] {
+    flex: 1;
+    position: relative;
+    text-align: center;
+    border-radius: 999px;
+    padding: 0.45rem 0.75rem;
+    font-weight: 600;
+    letter-spacing: 0.08em;
+    text-transform: uppercase;
+    color: var(--brand-muted);
+    cursor: pointer;
+    transition: all 0.25s ease;
+}
 
-            header[data-testid="stHeader"] {
-                background: transparent;
-            }
+.theme-toggle [role="radio"]::after {
+    content: "";
+    position: absolute;
+    inset: 2px;
+    border-radius: 999px;
+    background: transparent;
+    opacity: 0;
+    transition: opacity 0.25s ease;
+}
 
-            section[data-testid="stSidebar"] {
-                background: var(--sidebar-background);
-                backdrop-filter: blur(22px);
-                border-right: 1px solid var(--brand-border);
-            }
+.theme-toggle [role="radio"][aria-checked="true"] {
+    background: var(--toggle-track-active);
+    color: var(--brand-text);
+    box-shadow: 0 12px 26px rgba(37, 99, 235, 0.28);
+}
 
-            section[data-testid="stSidebar"] .block-container {
-                background: var(--sidebar-panel-bg);
-                border-radius: calc($border_radius - 6px);
-                padding: 1.2rem 1.05rem 1.6rem;
-                border: 1px solid var(--brand-border);
-                box-shadow: var(--brand-shadow);
-                backdrop-filter: blur(18px);
-            }
+.theme-toggle [role="radio"][aria-checked="true"]::after {
+    opacity: 1;
+    background: linear-gradient(135deg, transparent, var(--toggle-thumb-glint)33);
+}
 
-            section[data-testid="stSidebar"] .block-container > *:not(:last-child) {
-                margin-bottom: 0.85rem;
-            }
+.theme-toggle [role="radio"]:hover {
+    box-shadow: 0 0 0 2px var(--sidebar-control-hover);
+}
 
-            section[data-testid="stSidebar"] * {
-                color: var(--brand-text) !important;
-            }
+.sidebar-title {
+    font-size: 1.05rem;
+    font-weight: 600;
+    color: var(--brand-text);
+    margin-bottom: 0.35rem;
+}
 
-            section[data-testid="stSidebar"] .stMarkdown,
-            section[data-testid="stSidebar"] .stMarkdown p {
-                color: var(--brand-muted) !important;
-            }
+.sidebar-subtitle {
+    font-size: 0.85rem;
+    line-height: 1.5;
+    color: var(--brand-muted);
+    margin-bottom: 1.1rem;
+}
 
-            .theme-toggle {
-                margin: 0.6rem 0 0.4rem;
-            }
+section[data-testid="stSidebar"] label {
+    color: var(--brand-text) !important;
+    font-weight: 500;
+}
 
-            .theme-toggle::before {
-                content: "Color mode";
-                display: block;
-                font-size: 0.68rem;
-                letter-spacing: 0.2em;
-                text-transform: uppercase;
-                font-weight: 600;
-                color: var(--brand-muted);
-                margin-bottom: 0.45rem;
-            }
+section[data-testid="stSidebar"] .stSelectbox > div,
+section[data-testid="stSidebar"] .stMultiSelect > div,
+section[data-testid="stSidebar"] .stDateInput > div {
+    background: var(--sidebar-control-bg);
+    border: 1px solid var(--sidebar-control-border);
+    border-radius: 12px;
+    box-shadow: none;
+    transition: border-color 0.2s ease, box-shadow 0.2s ease, background 0.2s ease;
+}
 
-            .theme-toggle > div[role="radiogroup"] {
-                display: flex;
-                gap: 0.35rem;
-                background: var(--sidebar-control-bg);
-                border: 1px solid var(--sidebar-control-border);
-                border-radius: 999px;
-                padding: 0.25rem;
-            }
+section[data-testid="stSidebar"] div[data-baseweb="select"],
+section[data-testid="stSidebar"] div[data-baseweb="popover"],
+section[data-testid="stSidebar"] div[data-baseweb="input"],
+section[data-testid="stSidebar"] div[data-baseweb="datepicker"] {
+    background: var(--sidebar-control-bg) !important;
+    border: 1px solid var(--sidebar-control-border) !important;
+    border-radius: 12px !important;
+    box-shadow: none !important;
+    transition: border-color 0.2s ease, box-shadow 0.2s ease, background 0.2s ease;
+}
 
-            .theme-toggle [role="radio"] {
-                flex: 1;
-                position: relative;
-                text-align: center;
-                border-radius: 999px;
-                padding: 0.45rem 0.75rem;
-                font-weight: 600;
-                letter-spacing: 0.08em;
-                text-transform: uppercase;
-                color: var(--brand-muted);
-                cursor: pointer;
-                transition: all 0.25s ease;
-            }
+section[data-testid="stSidebar"] div[data-baseweb="select"] > div,
+section[data-testid="stSidebar"] div[data-baseweb="input"] > div,
+section[data-testid="stSidebar"] div[data-baseweb="datepicker"] > div,
+div[data-baseweb="popover"] ul,
+div[data-testid="stPlotlyChart"] .plot-container,
+div[data-testid="stPlotlyChart"] .plotly,
+div[data-testid="stPlotlyChart"] svg {
+    background: transparent !important;
+}
 
-            .theme-toggle [role="radio"]::after {
-                content: "";
-                position: absolute;
-                inset: 2px;
-                border-radius: 999px;
-                background: transparent;
-                opacity: 0;
-                transition: opacity 0.25s ease;
-            }
+section[data-testid="stSidebar"] .stSelectbox > div:hover,
+section[data-testid="stSidebar"] .stMultiSelect > div:hover,
+section[data-testid="stSidebar"] .stDateInput > div:hover,
+section[data-testid="stSidebar"] .stSelectbox > div:focus-within,
+section[data-testid="stSidebar"] .stMultiSelect > div:focus-within,
+section[data-testid="stSidebar"] .stDateInput > div:focus-within {
+    border-color: var(--brand-accent);
+    box-shadow: 0 0 0 2px var(--sidebar-control-hover);
+}
 
-            .theme-toggle [role="radio"][aria-checked="true"] {
-                background: var(--toggle-track-active);
-                color: var(--brand-text);
-                box-shadow: 0 12px 26px rgba(37, 99, 235, 0.28);
-            }
+div[data-testid="stSelectbox"] > div,
+div[data-testid="stMultiSelect"] > div,
+div[data-testid="stDateInput"] > div {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    border-radius: 12px !important;
+    box-shadow: none !important;
+    transition: border-color 0.2s ease, box-shadow 0.2s ease, background 0.2s ease;
+}
 
-            .theme-toggle [role="radio"][aria-checked="true"]::after {
-                opacity: 1;
-                background: linear-gradient(135deg, transparent, var(--toggle-thumb-glint)33);
-            }
+div[data-testid="stSelectbox"] > div:hover,
+div[data-testid="stMultiSelect"] > div:hover,
+div[data-testid="stDateInput"] > div:hover,
+div[data-testid="stSelectbox"] > div:focus-within,
+div[data-testid="stMultiSelect"] > div:focus-within,
+div[data-testid="stDateInput"] > div:focus-within {
+    border-color: var(--brand-accent) !important;
+    box-shadow: 0 0 0 2px var(--brand-accent-soft) !important;
+}
 
-            .theme-toggle [role="radio"]:hover {
-                box-shadow: 0 0 0 2px var(--sidebar-control-hover);
-            }
+div[data-testid="stSelectbox"] label,
+div[data-testid="stMultiSelect"] label,
+div[data-testid="stDateInput"] label {
+    color: var(--brand-muted) !important;
+    font-weight: 500;
+}
 
-            .sidebar-title {
-                font-size: 1.05rem;
-                font-weight: 600;
-                color: var(--brand-text);
-                margin-bottom: 0.35rem;
-            }
+div[data-baseweb="select"],
+div[data-baseweb="input"],
+div[data-baseweb="datepicker"] {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    border-radius: 12px !important;
+    box-shadow: none !important;
+}
 
-            .sidebar-subtitle {
-                font-size: 0.85rem;
-                line-height: 1.5;
-                color: var(--brand-muted);
-                margin-bottom: 1.1rem;
-            }
+div[data-baseweb="popover"] {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    border-radius: 14px !important;
+    box-shadow: var(--brand-shadow) !important;
+}
 
-            section[data-testid="stSidebar"] label {
-                color: var(--brand-text) !important;
-                font-weight: 500;
-            }
+div[data-baseweb="popover"] li {
+    color: var(--brand-text) !important;
+    border-radius: 8px;
+    margin: 2px 4px;
+}
 
-            section[data-testid="stSidebar"] .stSelectbox > div,
-            section[data-testid="stSidebar"] .stMultiSelect > div,
-            section[data-testid="stSidebar"] .stDateInput > div {
-                background: var(--sidebar-control-bg);
-                border: 1px solid var(--sidebar-control-border);
-                border-radius: 12px;
-                box-shadow: none;
-                transition: border-color 0.2s ease, box-shadow 0.2s ease, background 0.2s ease;
-            }
+div[data-baseweb="popover"] li:hover,
+div[data-baseweb="popover"] li[data-baseweb="option"]:hover {
+    background: var(--brand-accent-soft) !important;
+}
 
-            section[data-testid="stSidebar"] div[data-baseweb="select"],
-            section[data-testid="stSidebar"] div[data-baseweb="popover"],
-            section[data-testid="stSidebar"] div[data-baseweb="input"],
-            section[data-testid="stSidebar"] div[data-baseweb="datepicker"] {
-                background: var(--sidebar-control-bg) !important;
-                border: 1px solid var(--sidebar-control-border) !important;
-                border-radius: 12px !important;
-                box-shadow: none !important;
-                transition: border-color 0.2s ease, box-shadow 0.2s ease, background 0.2s ease;
-            }
+div[data-baseweb="tag"] {
+    background: linear-gradient(135deg, var(--brand-accent), var(--brand-accent-secondary)) !important;
+    color: #f8fafc !important;
+    border: none !important;
+    border-radius: 12px !important;
+    box-shadow: 0px 12px 24px rgba(37, 99, 235, 0.22) !important;
+    font-weight: 600;
+    letter-spacing: 0.01em;
+}
 
-            section[data-testid="stSidebar"] div[data-baseweb="select"] > div,
-            section[data-testid="stSidebar"] div[data-baseweb="input"] > div,
-            section[data-testid="stSidebar"] div[data-baseweb="datepicker"] > div {
-                background: transparent !important;
-            }
+div[data-baseweb="tag"] span {
+    color: #f8fafc !important;
+}
 
-            section[data-testid="stSidebar"] .stSelectbox > div:hover,
-            section[data-testid="stSidebar"] .stMultiSelect > div:hover,
-            section[data-testid="stSidebar"] .stDateInput > div:hover,
-            section[data-testid="stSidebar"] .stSelectbox > div:focus-within,
-            section[data-testid="stSidebar"] .stMultiSelect > div:focus-within,
-            section[data-testid="stSidebar"] .stDateInput > div:focus-within {
-                border-color: $accent_primary;
-                box-shadow: 0 0 0 2px var(--sidebar-control-hover);
-            }
+div[data-baseweb="tag"] svg path,
+div[data-baseweb="tag"] svg polygon {
+    fill: #f8fafc !important;
+}
 
-            section[data-testid="stSidebar"] input,
-            section[data-testid="stSidebar"] span,
-            section[data-testid="stSidebar"] select {
-                color: var(--brand-text) !important;
-            }
+div.block-container {
+    padding-top: 2.6rem;
+    max-width: 1180px;
+}
 
-            div[data-testid="stSelectbox"] > div,
-            div[data-testid="stMultiSelect"] > div,
-            div[data-testid="stDateInput"] > div {
-                background: var(--card-surface) !important;
-                border: 1px solid var(--card-border) !important;
-                border-radius: 12px !important;
-                box-shadow: none !important;
-                transition: border-color 0.2s ease, box-shadow 0.2s ease, background 0.2s ease;
-            }
+div[data-testid="stHorizontalBlock"] {
+    gap: 0.65rem !important;
+    align-items: stretch;
+}
 
-            div[data-testid="stSelectbox"] > div:hover,
-            div[data-testid="stMultiSelect"] > div:hover,
-            div[data-testid="stDateInput"] > div:hover,
-            div[data-testid="stSelectbox"] > div:focus-within,
-            div[data-testid="stMultiSelect"] > div:focus-within,
-            div[data-testid="stDateInput"] > div:focus-within {
-                border-color: $accent_primary !important;
-                box-shadow: 0 0 0 2px $accent_primary26 !important;
-            }
+div[data-testid="stHorizontalBlock"] > div[data-testid="column"] {
+    padding: 0 0.15rem;
+}
 
-            div[data-testid="stSelectbox"] label,
-            div[data-testid="stMultiSelect"] label,
-            div[data-testid="stDateInput"] label {
-                color: var(--brand-muted) !important;
-                font-weight: 500;
-            }
+div[data-testid="stHorizontalBlock"] button[kind] {
+    width: 100%;
+}
 
-            div[data-testid="stSelectbox"] input,
-            div[data-testid="stMultiSelect"] input,
-            div[data-testid="stDateInput"] input {
-                color: var(--brand-text) !important;
-            }
+.hero-header {
+    display: flex;
+    flex-direction: column;
+    gap: 1.8rem;
+    background: var(--card-surface);
+    border: 1px solid var(--card-border);
+    border-radius: var(--brand-radius);
+    padding: var(--hero-pad);
+    margin-bottom: 1.8rem;
+    box-shadow: var(--brand-shadow);
+    backdrop-filter: blur(24px);
+}
 
-            div[data-baseweb="select"],
-            div[data-baseweb="input"],
-            div[data-baseweb="datepicker"] {
-                background: var(--card-surface) !important;
-                border: 1px solid var(--card-border) !important;
-                border-radius: 12px !important;
-                box-shadow: none !important;
-            }
+.hero-header h1 {
+    font-size: var(--hero-title-size);
+    line-height: 1.18;
+    margin-bottom: 0.55rem;
+    color: var(--brand-text);
+}
 
-            div[data-baseweb="popover"] {
-                background: var(--card-surface) !important;
-                border: 1px solid var(--card-border) !important;
-                border-radius: 14px !important;
-                box-shadow: var(--brand-shadow) !important;
-            }
+.hero-subtitle {
+    font-size: var(--hero-subtitle-size);
+    color: var(--brand-muted);
+    max-width: 560px;
+    margin-bottom: 0.35rem;
+}
 
-            div[data-baseweb="popover"] ul {
-                background: transparent !important;
-            }
+.hero-theme {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.35rem;
+    margin-top: 0.35rem;
+    padding: 0.35rem 0.8rem;
+    border-radius: 999px;
+    border: 1px solid var(--card-border);
+    background: linear-gradient(135deg, var(--brand-accent-faint), var(--brand-accent-secondary-faint));
+    color: var(--brand-text);
+    font-size: 0.78rem;
+    font-weight: 600;
+    letter-spacing: 0.05em;
+    text-transform: uppercase;
+}
 
-            div[data-baseweb="popover"] li {
-                color: var(--brand-text) !important;
-                border-radius: 8px;
-                margin: 2px 4px;
-            }
+.hero-eyebrow {
+    font-size: 0.75rem;
+    letter-spacing: 0.28em;
+    text-transform: uppercase;
+    font-weight: 600;
+    color: var(--brand-accent-secondary);
+    margin-bottom: 0.75rem;
+}
 
-            div[data-baseweb="popover"] input {
-                color: var(--brand-text) !important;
-            }
+.stTabs [data-baseweb="tab-list"] {
+    gap: 0.75rem;
+    border-bottom: 1px solid var(--card-border);
+}
 
-            div[data-baseweb="popover"] li:hover,
-            div[data-baseweb="popover"] li[data-baseweb="option"]:hover {
-                background: $accent_primary26 !important;
-            }
+.stTabs [data-baseweb="tab"] {
+    padding: 0.75rem 1.4rem;
+    background: var(--card-surface) !important;
+    background-color: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    border-radius: 999px;
+    color: var(--brand-muted) !important;
+    font-weight: 600;
+    transition: all 0.25s ease;
+}
 
-            div[data-baseweb="tag"] {
-                background: linear-gradient(135deg, $accent_primary, $accent_secondary) !important;
-                color: #f8fafc !important;
-                border: none !important;
-                border-radius: 12px !important;
-                box-shadow: 0px 12px 24px rgba(37, 99, 235, 0.22) !important;
-                font-weight: 600;
-                letter-spacing: 0.01em;
-            }
+.stTabs [aria-selected="true"] {
+    background: linear-gradient(135deg, var(--brand-accent-strong), var(--brand-accent-secondary-strong));
+    background-color: transparent;
+    color: var(--brand-text);
+    box-shadow: 0px 16px 38px rgba(37, 99, 235, 0.28);
+    border-color: transparent;
+}
 
-            div[data-baseweb="tag"] span {
-                color: #f8fafc !important;
-            }
+div[data-testid="stMetric"] {
+    background: var(--card-surface);
+    border: 1px solid var(--card-border);
+    border-radius: var(--brand-radius);
+    padding: 1.05rem 1.25rem;
+    box-shadow: var(--brand-shadow);
+    backdrop-filter: blur(20px);
+}
 
-            div[data-baseweb="tag"] svg path,
-            div[data-baseweb="tag"] svg polygon {
-                fill: #f8fafc !important;
-            }
+div[data-testid="stMetricValue"] {
+    color: var(--metric-value);
+    font-size: 1.7rem;
+    font-weight: 600;
+}
 
-            div.block-container {
-                padding-top: 2.6rem;
-                max-width: 1180px;
-            }
+div[data-testid="stMetricLabel"] {
+    color: var(--brand-muted) !important;
+    font-weight: 500;
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+}
 
-            div[data-testid="stHorizontalBlock"] {
-                gap: 0.65rem !important;
-                align-items: stretch;
-            }
+div[data-testid="stPlotlyChart"] {
+    background: var(--chart-surface) !important;
+    border: 1px solid var(--chart-border) !important;
+    border-radius: var(--brand-radius);
+    padding: 0.25rem 0.35rem 0.45rem;
+    box-shadow: var(--brand-shadow);
+    backdrop-filter: blur(18px);
+    box-sizing: border-box;
+    max-width: 100%;
+    overflow: hidden;
+}
 
-            div[data-testid="stHorizontalBlock"] > div[data-testid="column"] {
-                padding: 0 0.15rem;
-            }
+div[data-testid="stPlotlyChart"] > div:first-child {
+    width: 100% !important;
+    margin: 0 auto;
+}
 
-            div[data-testid="stHorizontalBlock"] button[kind] {
-                width: 100%;
-            }
+div[data-testid="stPlotlyChart"] .plotly .bg,
+div[data-testid="stPlotlyChart"] .plotly .subplot.xy .bg,
+div[data-testid="stPlotlyChart"] .plotly .cartesianlayer .bg,
+div[data-testid="stPlotlyChart"] .plotly .hoverlayer path,
+div[data-testid="stPlotlyChart"] .plotly .legend path,
+div[data-testid="stPlotlyChart"] .plotly .legend rect {
+    fill: var(--chart-surface) !important;
+}
 
-            .hero-header {
-                display: flex;
-                flex-direction: column;
-                gap: 1.8rem;
-                background: var(--card-surface);
-                border: 1px solid var(--card-border);
-                border-radius: var(--brand-radius);
-                padding: 2.2rem 2.4rem;
-                margin-bottom: 1.8rem;
-                box-shadow: var(--brand-shadow);
-                backdrop-filter: blur(24px);
-            }
+div[data-testid="column"] {
+    min-width: 0 !important;
+}
 
-            .hero-header h1 {
-                font-size: 2.3rem;
-                line-height: 1.18;
-                margin-bottom: 0.55rem;
-                color: var(--brand-text);
-            }
+div[data-testid="stDataFrame"] {
+    background: var(--card-surface);
+    border: 1px solid var(--card-border);
+    border-radius: var(--brand-radius);
+    padding: var(--dataframe-pad);
+    box-shadow: var(--brand-shadow);
+    backdrop-filter: blur(18px);
+}
 
-            .hero-subtitle {
-                font-size: 1.02rem;
-                color: var(--brand-muted);
-                max-width: 560px;
-                margin-bottom: 0.35rem;
-            }
+div[data-testid="stDataFrame"] table {
+    font-family: var(--brand-font);
+    color: var(--brand-text);
+}
 
-            .hero-theme {
-                display: inline-flex;
-                align-items: center;
-                gap: 0.35rem;
-                margin-top: 0.35rem;
-                padding: 0.35rem 0.8rem;
-                border-radius: 999px;
-                border: 1px solid var(--card-border);
-                background: linear-gradient(135deg, $accent_primary1f, $accent_secondary1f);
-                color: var(--brand-text);
-                font-size: 0.78rem;
-                font-weight: 600;
-                letter-spacing: 0.05em;
-                text-transform: uppercase;
-            }
+div[data-testid="stDataFrame"] thead tr {
+    background: var(--table-header-bg);
+}
 
-            .hero-eyebrow {
-                font-size: 0.75rem;
-                letter-spacing: 0.28em;
-                text-transform: uppercase;
-                font-weight: 600;
-                color: var(--brand-accent-secondary);
-                margin-bottom: 0.75rem;
-            }
+div[data-testid="stDataFrame"] tbody td {
+    border-color: var(--table-border) !important;
+}
 
-            .stTabs [data-baseweb="tab-list"] {
-                gap: 0.75rem;
-                border-bottom: 1px solid var(--card-border);
-            }
+.stSelectbox,
+.stMultiSelect,
+.stDateInput {
+    border-radius: 12px !important;
+}
 
-            .stTabs [data-baseweb="tab"] {
-                padding: 0.75rem 1.4rem;
-                background: var(--card-surface) !important;
-                background-color: var(--card-surface) !important;
-                border: 1px solid var(--card-border) !important;
-                border-radius: 999px;
-                color: var(--brand-muted) !important;
-                font-weight: 600;
-                transition: all 0.25s ease;
-            }
+button[kind="primary"],
+div[data-testid="stFormSubmitButton"] button {
+    border-radius: 14px;
+    background: linear-gradient(135deg, var(--brand-accent), var(--brand-accent-secondary));
+    border: 1px solid transparent;
+    color: white;
+    font-weight: 600;
+    font-size: 0.9rem;
+    padding: 0.6rem 1.25rem;
+    min-height: 44px;
+    box-shadow: 0px 12px 28px rgba(99, 102, 241, 0.32);
+    transition: transform 0.2s ease, box-shadow 0.2s ease;
+}
 
-            .stTabs [aria-selected="true"] {
-                background: linear-gradient(135deg, $accent_primarycc, $accent_secondarycc);
-                background-color: transparent;
-                color: var(--brand-text);
-                box-shadow: 0px 16px 38px rgba(37, 99, 235, 0.28);
-                border-color: transparent;
-            }
+button[kind="primary"]:hover,
+div[data-testid="stFormSubmitButton"] button:hover {
+    transform: translateY(-1px);
+    box-shadow: 0px 18px 36px rgba(99, 102, 241, 0.34);
+}
 
-            div[data-testid="stMetric"] {
-                background: var(--card-surface);
-                border: 1px solid var(--card-border);
-                border-radius: var(--brand-radius);
-                padding: 1.05rem 1.25rem;
-                box-shadow: var(--brand-shadow);
-                backdrop-filter: blur(20px);
-            }
+button[kind="primary"]:focus-visible,
+div[data-testid="stFormSubmitButton"] button:focus-visible,
+button[kind="secondary"]:focus-visible {
+    outline: 2px solid var(--brand-accent-soft);
+    outline-offset: 2px;
+}
 
-            div[data-testid="stMetricValue"] {
-                color: var(--metric-value);
-                font-size: 1.7rem;
-                font-weight: 600;
-            }
+button[kind="secondary"] {
+    border-radius: 14px;
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    color: var(--brand-muted) !important;
+    font-weight: 600;
+    font-size: 0.9rem;
+    padding: 0.6rem 1.1rem;
+    min-height: 44px;
+    line-height: 1.15;
+    letter-spacing: 0.01em;
+    text-transform: none;
+    box-shadow: none !important;
+    transition: all 0.22s ease;
+}
 
-            div[data-testid="stMetricLabel"] {
-                color: var(--brand-muted) !important;
-                font-weight: 500;
-                text-transform: uppercase;
-                letter-spacing: 0.05em;
-            }
+button[kind="secondary"]:hover,
+button[kind="secondary"][aria-pressed="true"],
+button[kind="secondary"]:focus-visible {
+    color: var(--brand-text) !important;
+    border-color: var(--brand-accent) !important;
+    box-shadow: 0px 12px 28px rgba(37, 99, 235, 0.18) !important;
+}
 
-            div[data-testid="stPlotlyChart"] {
-                background: var(--chart-surface) !important;
-                border: 1px solid var(--chart-border) !important;
-                border-radius: var(--brand-radius);
-                padding: 0.25rem 0.35rem 0.45rem;
-                box-shadow: var(--brand-shadow);
-                backdrop-filter: blur(18px);
-                box-sizing: border-box;
-                max-width: 100%;
-                overflow: hidden;
-            }
+div[data-testid="stMarkdown"] h1,
+div[data-testid="stMarkdown"] h2,
+div[data-testid="stMarkdown"] h3,
+.stMarkdown h1,
+.stMarkdown h2,
+.stMarkdown h3 {
+    color: var(--brand-text);
+    font-weight: 650;
+}
 
-            div[data-testid="stPlotlyChart"] svg {
-                background: transparent;
-            }
+.insight-card {
+    background: var(--card-surface);
+    border: 1px solid var(--card-border);
+    border-radius: calc(var(--brand-radius) - 6px);
+    padding: 1.2rem 1.4rem;
+    margin-bottom: 0.6rem;
+    box-shadow: var(--brand-shadow);
+    backdrop-filter: blur(16px);
+}
 
-            div[data-testid="stPlotlyChart"] > div:first-child {
-                width: 100% !important;
-                margin: 0 auto;
-            }
+.insight-card--marketing {
+    border-left: 4px solid var(--brand-accent);
+}
 
-            div[data-testid="stPlotlyChart"] .plot-container,
-            div[data-testid="stPlotlyChart"] .plotly,
-            div[data-testid="stPlotlyChart"] svg {
-                background: transparent !important;
-            }
+.insight-card--pipeline {
+    border-left: 4px solid var(--brand-accent-secondary);
+}
 
-            div[data-testid="stPlotlyChart"] .plotly .bg,
-            div[data-testid="stPlotlyChart"] .plotly .subplot.xy .bg,
-            div[data-testid="stPlotlyChart"] .plotly .cartesianlayer .bg {
-                fill: var(--chart-surface) !important;
-            }
+.insight-card--revenue {
+    border-left: 4px solid var(--brand-accent-tertiary);
+}
 
-            div[data-testid="stPlotlyChart"] .plotly .hoverlayer path {
-                fill: var(--chart-surface) !important;
-            }
+.insight-chip {
+    display: inline-block;
+    font-size: 0.7rem;
+    letter-spacing: 0.16em;
+    text-transform: uppercase;
+    color: var(--brand-accent-secondary);
+}
 
-            div[data-testid="stPlotlyChart"] .plotly .legend path,
-            div[data-testid="stPlotlyChart"] .plotly .legend rect {
-                fill: var(--chart-surface) !important;
-            }
+.insight-message {
+    font-size: var(--insight-message-size);
+    color: var(--brand-text);
+    margin: 0.35rem 0 0.2rem 0;
+}
 
-            div[data-testid="column"] {
-                min-width: 0 !important;
-            }
+div[data-testid="stProgressBar"] {
+    background: linear-gradient(90deg, var(--brand-accent-soft), var(--brand-accent-secondary-soft));
+    border-radius: 999px;
+    height: 10px;
+    margin: 0.4rem 0 0.7rem 0;
+}
 
-            div[data-testid="stDataFrame"] {
-                background: var(--card-surface);
-                border: 1px solid var(--card-border);
-                border-radius: var(--brand-radius);
-                padding: 0.65rem 0.55rem 0.5rem;
-                box-shadow: var(--brand-shadow);
-                backdrop-filter: blur(18px);
-            }
+div[data-testid="stProgressBar"] > div {
+    background: linear-gradient(135deg, var(--brand-accent), var(--brand-accent-secondary));
+    border-radius: 999px;
+}
 
-            div[data-testid="stDataFrame"] table {
-                font-family: $font_family;
-                color: var(--brand-text);
-            }
+.stDivider {
+    border-top: 1px solid var(--card-border) !important;
+}
 
-            div[data-testid="stDataFrame"] thead tr {
-                background: var(--table-header-bg);
-            }
+@media (max-width: 1200px) {
+    :root {
+        --hero-pad: 1.9rem 1.8rem;
+    }
 
-            div[data-testid="stDataFrame"] tbody td {
-                border-color: var(--table-border) !important;
-            }
+    div.block-container {
+        max-width: 100%;
+        padding: var(--block-pad);
+    }
 
-            .stSelectbox,
-            .stMultiSelect,
-            .stDateInput {
-                border-radius: 12px !important;
-            }
+    .stTabs [data-baseweb="tab-list"] {
+        overflow-x: auto;
+        padding-bottom: 0.5rem;
+    }
 
-            div[data-testid="stFormSubmitButton"] button,
-            button[kind="primary"],
-            div[data-testid="stFormSubmitButton"] button {
-                border-radius: 14px;
-                background: linear-gradient(135deg, $accent_primary, $accent_secondary);
-                border: 1px solid transparent;
-                color: white;
-                font-weight: 600;
-                font-size: 0.9rem;
-                padding: 0.6rem 1.25rem;
-                min-height: 44px;
-                box-shadow: 0px 12px 28px rgba(99, 102, 241, 0.32);
-                transition: transform 0.2s ease, box-shadow 0.2s ease;
-            }
+    .stTabs [data-baseweb="tab"] {
+        flex: 0 0 auto;
+    }
+}
 
-            button[kind="primary"]:hover,
-            div[data-testid="stFormSubmitButton"] button:hover {
-                transform: translateY(-1px);
-                box-shadow: 0px 18px 36px rgba(99, 102, 241, 0.34);
-            }
+@media (max-width: 960px) {
+    :root {
+        --hero-pad: 1.7rem 1.5rem;
+    }
 
-            button[kind="primary"]:focus-visible,
-            div[data-testid="stFormSubmitButton"] button:focus-visible {
-                outline: 2px solid $accent_primary26;
-                outline-offset: 2px;
-            }
+    section[data-testid="stSidebar"] {
+        width: var(--sidebar-w);
+    }
 
-            button[kind="secondary"] {
-                border-radius: 14px;
-                background: var(--card-surface) !important;
-                border: 1px solid var(--card-border) !important;
-                color: var(--brand-muted) !important;
-                font-weight: 600;
-                font-size: 0.9rem;
-                padding: 0.6rem 1.1rem;
-                min-height: 44px;
-                line-height: 1.15;
-                letter-spacing: 0.01em;
-                text-transform: none;
-                box-shadow: none !important;
-                transition: all 0.22s ease;
-            }
+    div[data-testid="column"] {
+        flex: 1 1 100% !important;
+        min-width: 100% !important;
+    }
 
-            button[kind="secondary"]:hover,
-            button[kind="secondary"][aria-pressed="true"],
-            button[kind="secondary"]:focus-visible {
-                color: var(--brand-text) !important;
-                border-color: $accent_primary !important;
-                box-shadow: 0px 12px 28px rgba(37, 99, 235, 0.18) !important;
-            }
+    div[data-testid="stMetric"] {
+        margin-bottom: 0.9rem;
+    }
+}
 
-            button[kind="secondary"]:focus-visible {
-                outline: 2px solid $accent_primary26;
-                outline-offset: 2px;
-            }
+@media (max-width: 640px) {
+    :root {
+        --hero-title-size: 1.85rem;
+        --hero-subtitle-size: 0.95rem;
+        --insight-message-size: 0.92rem;
+        --dataframe-pad: 0.45rem 0.35rem 0.35rem;
+        --block-pad: 1.4rem 1.1rem;
+        --sidebar-w: 220px;
+    }
+}
+""".strip()
+
+# Overrides emitted only for light-based themes, scoped by the hidden ``data-theme-mode`` marker.
+_LIGHT_MODE_CSS = """
+body:has([data-theme-mode="light"]),
+body:has([data-theme-mode="light"]) div[data-testid="stAppViewContainer"] {
+    background: var(--brand-gradient);
+    color: var(--brand-text);
+}
 
-            div[data-testid="stMarkdown"] h1,
-            div[data-testid="stMarkdown"] h2,
-            div[data-testid="stMarkdown"] h3,
-            .stMarkdown h1,
-            .stMarkdown h2,
-            .stMarkdown h3 {
-                color: var(--brand-text);
-                font-weight: 650;
-            }
+body:has([data-theme-mode="light"]) ::selection {
+    background: var(--brand-accent-soft);
+    color: var(--brand-text);
+}
 
-            .insight-card {
-                background: var(--card-surface);
-                border: 1px solid var(--card-border);
-                border-radius: calc($border_radius - 6px);
-                padding: 1.2rem 1.4rem;
-                margin-bottom: 0.6rem;
-                box-shadow: var(--brand-shadow);
-                backdrop-filter: blur(16px);
-            }
+body:has([data-theme-mode="light"]) header[data-testid="stHeader"] {
+    background: transparent;
+}
 
-            .insight-card--marketing {
-                border-left: 4px solid $accent_primary;
-            }
+body:has([data-theme-mode="light"]) section[data-testid="stSidebar"] {
+    background: var(--sidebar-background);
+    border-right: 1px solid var(--card-border);
+    backdrop-filter: blur(22px);
+    box-shadow: none;
+}
 
-            .insight-card--pipeline {
-                border-left: 4px solid $accent_secondary;
-            }
+body:has([data-theme-mode="light"]) section[data-testid="stSidebar"] .block-container {
+    background: var(--sidebar-panel-bg);
+    border: 1px solid var(--card-border);
+    border-radius: calc(var(--brand-radius) - 6px);
+    box-shadow: var(--brand-shadow);
+}
 
-            .insight-card--revenue {
-                border-left: 4px solid $accent_tertiary;
-            }
+body:has([data-theme-mode="light"]) section[data-testid="stSidebar"] *,
+body:has([data-theme-mode="light"]) div[data-baseweb="select"] input,
+body:has([data-theme-mode="light"]) div[data-baseweb="input"] input,
+body:has([data-theme-mode="light"]) div[data-baseweb="datepicker"] input,
+body:has([data-theme-mode="light"]) div[data-baseweb="popover"] li,
+body:has([data-theme-mode="light"]) div[data-baseweb="popover"] input {
+    color: var(--brand-text) !important;
+}
 
-            .insight-chip {
-                display: inline-block;
-                font-size: 0.7rem;
-                letter-spacing: 0.16em;
-                text-transform: uppercase;
-                color: $accent_secondary;
-            }
+body:has([data-theme-mode="light"]) section[data-testid="stSidebar"] .stMarkdown,
+body:has([data-theme-mode="light"]) section[data-testid="stSidebar"] .stMarkdown p,
+body:has([data-theme-mode="light"]) div[data-testid="stMetricLabel"],
+body:has([data-theme-mode="light"]) div[data-testid="stSelectbox"] label,
+body:has([data-theme-mode="light"]) div[data-testid="stMultiSelect"] label,
+body:has([data-theme-mode="light"]) div[data-testid="stDateInput"] label {
+    color: var(--brand-muted) !important;
+}
 
-            .insight-message {
-                font-size: 1.02rem;
-                color: var(--brand-text);
-                margin: 0.35rem 0 0.2rem 0;
-            }
+body:has([data-theme-mode="light"]) .theme-toggle > div[role="radiogroup"] {
+    background: var(--sidebar-control-bg);
+    border: 1px solid var(--sidebar-control-border);
+}
 
-            div[data-testid="stProgressBar"] {
-                background: linear-gradient(90deg, $accent_primary26, $accent_secondary26);
-                border-radius: 999px;
-                height: 10px;
-                margin: 0.4rem 0 0.7rem 0;
-            }
+body:has([data-theme-mode="light"]) .theme-toggle [role="radio"] {
+    color: var(--brand-muted);
+}
 
-            div[data-testid="stProgressBar"] > div {
-                background: linear-gradient(135deg, $accent_primary, $accent_secondary);
-                border-radius: 999px;
-            }
+body:has([data-theme-mode="light"]) .theme-toggle [role="radio"][aria-checked="true"] {
+    color: var(--brand-text);
+    box-shadow: 0 10px 26px rgba(37, 99, 235, 0.24);
+}
 
-            .stDivider {
-                border-top: 1px solid var(--card-border) !important;
-            }
+body:has([data-theme-mode="light"]) .stTabs [data-baseweb="tab-list"] {
+    border-color: var(--card-border);
+}
 
-            @media (max-width: 1200px) {
-                div.block-container {
-                    max-width: 100%;
-                    padding: 2rem 1.8rem;
-                }
+body:has([data-theme-mode="light"]) .stTabs [data-baseweb="tab"] {
+    background: var(--card-surface) !important;
+    border-color: var(--card-border) !important;
+    color: var(--brand-muted) !important;
+    box-shadow: none !important;
+}
 
-                .hero-header {
-                    padding: 1.9rem 1.8rem;
-                }
+body:has([data-theme-mode="light"]) .stTabs [aria-selected="true"] {
+    color: var(--brand-text) !important;
+    box-shadow: 0 14px 32px rgba(37, 99, 235, 0.22);
+}
 
-                .stTabs [data-baseweb="tab-list"] {
-                    overflow-x: auto;
-                    padding-bottom: 0.5rem;
-                }
+body:has([data-theme-mode="light"]) div[data-testid="stMetric"],
+body:has([data-theme-mode="light"]) div[data-testid="stDataFrame"],
+body:has([data-theme-mode="light"]) .marketing-table__card,
+body:has([data-theme-mode="light"]) .insight-card {
+    background: var(--card-surface);
+    border: 1px solid var(--card-border);
+    box-shadow: var(--brand-shadow);
+}
 
-                .stTabs [data-baseweb="tab"] {
-                    flex: 0 0 auto;
-                }
-            }
+body:has([data-theme-mode="light"]) div[data-testid="stMetricValue"] {
+    color: var(--metric-value);
+}
 
-            @media (max-width: 960px) {
-                .hero-header {
-                    padding: 1.7rem 1.5rem;
-                }
+body:has([data-theme-mode="light"]) div[data-testid="stPlotlyChart"] {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--chart-border) !important;
+    box-shadow: var(--brand-shadow);
+}
 
-                section[data-testid="stSidebar"] {
-                    width: 260px;
-                }
+body:has([data-theme-mode="light"]) div[data-testid="stPlotlyChart"] .plotly .bg,
+body:has([data-theme-mode="light"]) div[data-testid="stPlotlyChart"] .plotly .cartesianlayer .bg,
+body:has([data-theme-mode="light"]) div[data-testid="stPlotlyChart"] .plotly .legend rect,
+body:has([data-theme-mode="light"]) div[data-testid="stPlotlyChart"] .plotly .legend path {
+    fill: var(--chart-surface) !important;
+}
 
-                div[data-testid="column"] {
-                    flex: 1 1 100% !important;
-                    min-width: 100% !important;
-                }
+body:has([data-theme-mode="light"]) div[data-testid="stPlotlyChart"] .plotly text,
+body:has([data-theme-mode="light"]) div[data-testid="stPlotlyChart"] .hoverlayer text {
+    fill: var(--brand-text) !important;
+}
 
-                div[data-testid="stMetric"] {
-                    margin-bottom: 0.9rem;
-                }
-            }
+body:has([data-theme-mode="light"]) div[data-testid="stSelectbox"] > div,
+body:has([data-theme-mode="light"]) div[data-testid="stMultiSelect"] > div,
+body:has([data-theme-mode="light"]) div[data-testid="stDateInput"] > div {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    box-shadow: none !important;
+}
 
-            @media (max-width: 640px) {
-                div.block-container {
-                    padding: 1.4rem 1.1rem;
-                }
+body:has([data-theme-mode="light"]) div[data-baseweb="select"],
+body:has([data-theme-mode="light"]) div[data-baseweb="input"],
+body:has([data-theme-mode="light"]) div[data-baseweb="datepicker"] {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    border-radius: 12px !important;
+    box-shadow: none !important;
+    color: var(--brand-text) !important;
+}
 
-                .hero-header h1 {
-                    font-size: 1.85rem;
-                }
+body:has([data-theme-mode="light"]) div[data-baseweb="popover"] {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    box-shadow: var(--brand-shadow) !important;
+}
 
-                .hero-subtitle {
-                    font-size: 0.95rem;
-                }
+body:has([data-theme-mode="light"]) div[data-baseweb="popover"] li:hover,
+body:has([data-theme-mode="light"]) div[data-baseweb="popover"] li[data-baseweb="option"]:hover {
+    background: var(--sidebar-control-hover) !important;
+}
 
-                section[data-testid="stSidebar"] {
-                    width: 220px;
-                }
+body:has([data-theme-mode="light"]) div[data-baseweb="tag"] {
+    background: linear-gradient(135deg, var(--brand-accent), var(--brand-accent-secondary)) !important;
+    color: #f8fafc !important;
+    border: none !important;
+    box-shadow: 0 12px 24px rgba(37, 99, 235, 0.2) !important;
+}
 
-                .insight-message {
-                    font-size: 0.92rem;
-                }
+body:has([data-theme-mode="light"]) div[data-baseweb="tag"] span,
+body:has([data-theme-mode="light"]) div[data-baseweb="tag"] svg path,
+body:has([data-theme-mode="light"]) div[data-baseweb="tag"] svg polygon {
+    fill: #f8fafc !important;
+    color: #f8fafc !important;
+}
 
-                div[data-testid="stDataFrame"] {
-                    padding: 0.45rem 0.35rem 0.35rem;
-                }
-            }
+body:has([data-theme-mode="light"]) button[kind="primary"],
+body:has([data-theme-mode="light"]) div[data-testid="stFormSubmitButton"] button {
+    background: linear-gradient(135deg, var(--brand-accent), var(--brand-accent-secondary));
+    box-shadow: 0 16px 32px rgba(37, 99, 235, 0.28);
+    border: 1px solid transparent;
+}
 
-            $mode_specific_rules
-        </style>
-        <script>
-            const body = document.body;
-            if (body) {
-                body.dataset.themeMode = "$color_scheme";
-            }
-            document.documentElement.dataset.themeMode = "$color_scheme";
-        </script>
-        """
-    )
+body:has([data-theme-mode="light"]) button[kind="secondary"] {
+    background: var(--card-surface) !important;
+    border: 1px solid var(--card-border) !important;
+    color: var(--brand-muted) !important;
+    box-shadow: none !important;
+}
+
+body:has([data-theme-mode="light"]) button[kind="secondary"]:hover,
+body:has([data-theme-mode="light"]) button[kind="secondary"][aria-pressed="true"] {
+    color: var(--brand-text) !important;
+    border-color: var(--brand-accent) !important;
+    box-shadow: 0 10px 20px rgba(37, 99, 235, 0.18) !important;
+}
+
+body:has([data-theme-mode="light"]) div[data-testid="stDataFrame"] table,
+body:has([data-theme-mode="light"]) div[data-testid="stMarkdown"] h1,
+body:has([data-theme-mode="light"]) div[data-testid="stMarkdown"] h2,
+body:has([data-theme-mode="light"]) div[data-testid="stMarkdown"] h3,
+body:has([data-theme-mode="light"]) .stMarkdown h1,
+body:has([data-theme-mode="light"]) .stMarkdown h2,
+body:has([data-theme-mode="light"]) .stMarkdown h3 {
+    color: var(--brand-text);
+}
+
+body:has([data-theme-mode="light"]) div[data-testid="stDataFrame"] thead tr {
+    background: var(--table-header-bg) !important;
+}
+
+body:has([data-theme-mode="light"]) div[data-testid="stDataFrame"] tbody td {
+    border-color: var(--table-border) !important;
+}
 
-    css = template.substitute(
-        color_scheme=theme.base,
-        surface_color=theme.surface_color,
-        surface_border=theme.surface_border,
-        border_radius=theme.border_radius,
-        overlay_shadow=theme.overlay_shadow,
-        text_color=theme.text_color,
-        muted_text=theme.muted_text,
-        accent_primary=theme.accent_primary,
-        accent_secondary=theme.accent_secondary,
-        accent_tertiary=theme.accent_tertiary,
-        font_family=theme.font_family,
-        gradient_background=theme.gradient_background,
-        accent_primary1f=accent_primary1f,
-        accent_secondary1f=accent_secondary1f,
-        accent_primarycc=accent_primarycc,
-        accent_secondarycc=accent_secondarycc,
-        accent_primary26=accent_primary26,
-        accent_secondary26=accent_secondary26,
-        mode_specific_rules=mode_specific_rules,
-        **tokens,
+body:has([data-theme-mode="light"]) div[data-testid="stDataFrame"] tbody tr:nth-child(even),
+body:has([data-theme-mode="light"]) .marketing-table tbody tr:nth-child(even) {
+    background: rgba(148, 163, 184, 0.12);
+}
+
+body:has([data-theme-mode="light"]) div[data-testid="stDataFrame"] tbody tr:hover,
+body:has([data-theme-mode="light"]) .marketing-table tbody tr:hover {
+    background: var(--sidebar-control-hover);
+}
+
+body:has([data-theme-mode="light"]) .insight-chip {
+    color: var(--brand-accent-secondary);
+}
+
+body:has([data-theme-mode="light"]) .stDivider {
+    border-top: 1px solid var(--card-border) !important;
+}
+
+body:has([data-theme-mode="light"]) div[data-testid="stProgressBar"] {
+    background: linear-gradient(90deg, var(--brand-accent-soft), var(--brand-accent-secondary-soft));
+}
+
+body:has([data-theme-mode="light"]) div[data-testid="stProgressBar"] > div {
+    background: linear-gradient(135deg, var(--brand-accent), var(--brand-accent-secondary));
+}
+""".strip()
+
+_MODE_RULES: Mapping[str, str] = {"dark": "", "light": _LIGHT_MODE_CSS}
+
+# The font stylesheet is fetched in parallel with the inline rules instead of blocking them
+# the way a CSS ``@import`` would; the font files themselves come from fonts.gstatic.com.
+_FONT_LINKS = """
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Plus+Jakarta+Sans:wght@500;600&display=swap">
+""".strip()
+
+# ``<style>`` opens the payload so markdown treats everything up to ``</style>`` as one raw
+# HTML block; the ``<link>`` tags after it would end their block at the first blank line.
+_STYLE_TEMPLATE = Template(
+    """
+<style>
+$root_block
+$static_css
+$mode_specific_rules
+</style>
+"""
+    + _FONT_LINKS
+    + """
+<div data-theme-mode="$color_scheme" hidden></div>
+"""
+)
+
+
+_MINIFY_RE = re.compile(r"\s+")
+
+
+def _minify(css: str) -> str:
+    """Collapse whitespace and drop the padding around CSS punctuation."""
+
+    return (
+        _MINIFY_RE.sub(" ", css)
+        .replace(" {", "{")
+        .replace("{ ", "{")
+        .replace(" }", "}")
+        .replace("} ", "}")
+        .replace(": ", ":")
+        .replace("; ", ";")
+        .strip()
     )
 
+
+@lru_cache(maxsize=8)
+def _render_css(theme: BrandTheme) -> str:
+    """Return the complete, minified ``<style>`` payload for the provided theme.
+
+    ``BrandTheme`` is frozen and hashable, so the payload is cached per theme instance.
+    """
+
+    return _minify(_STYLE_TEMPLATE.substitute(theme.substitution_map))
+
+
+# Built-in themes are rendered once at import and looked up by key, which is far cheaper
+# than hashing every ``BrandTheme`` field. Entries are only used for the exact instance
+# they were rendered from; any other theme (including ``dataclasses.replace`` copies of a
+# built-in) falls back to ``_render_css``.
+_CSS_BY_KEY: Mapping[str, tuple[BrandTheme, str]] = MappingProxyType(
+    {theme.key: (theme, _render_css(theme)) for theme in AVAILABLE_THEMES.values()}
+)
+
+
+# Theme instance each ``revops-<key>`` template was built from; a different instance
+# sharing the key (e.g. from ``dataclasses.replace``) triggers a rebuild.
+_TEMPLATE_SOURCES: dict[str, BrandTheme] = {}
+
+
+def _build_and_register(theme: BrandTheme) -> str:
+    """Build the Plotly template for ``theme`` and add it to ``pio.templates``."""
+
+    template_name = f"revops-{theme.key}"
+    pio.templates[template_name] = go.layout.Template(layout=theme.plotly_layout)
+    _TEMPLATE_SOURCES[template_name] = theme
+    return template_name
+
+
+# Template construction validates the whole layout tree, so built-in themes pay it once at import.
+for _builtin_theme in AVAILABLE_THEMES.values():
+    _build_and_register(_builtin_theme)
+
+
+def register_plotly_template(theme: BrandTheme) -> str:
+    """Register and return the Plotly template name for the provided theme."""
+
+    template_name = f"revops-{theme.key}"
+    if _TEMPLATE_SOURCES.get(template_name) is not theme or template_name not in pio.templates:
+        _build_and_register(theme)
+    return template_name
+
+
+# ``px.defaults`` is process-wide, so the last applied theme is tracked per process.
+_PX_APPLIED_THEME: Optional[BrandTheme] = None
+
+
+def apply_plotly_theme(theme: BrandTheme) -> None:
+    """Apply the project-wide Plotly defaults."""
+
+    global _PX_APPLIED_THEME
+    if _PX_APPLIED_THEME is theme:
+        return
+
+    template_name = register_plotly_template(theme)
+    px.defaults.template = template_name
+    px.defaults.color_discrete_sequence = theme.colorway_list
+    _PX_APPLIED_THEME = theme
+
+
+def inject_global_styles(theme: BrandTheme) -> None:
+    """Inject global CSS overrides for a modern, AI SaaS aesthetic.
+
+    Call this on every script run: Streamlit removes elements that a rerun does
+    not render, so skipping the call behind a session flag would drop the styles.
+    """
+
+    entry = _CSS_BY_KEY.get(theme.key)
+    css = entry[1] if entry is not None and entry[0] is theme else _render_css(theme)
     st.markdown(css, unsafe_allow_html=True)
 
 
 def apply_theme(theme_name: str) -> BrandTheme:
     """Apply the selected theme (Plotly + CSS) and return it."""
 
-    theme = AVAILABLE_THEMES.get(theme_name, AVAILABLE_THEMES[DEFAULT_THEME_NAME])
+    theme = AVAILABLE_THEMES.get(theme_name) or AVAILABLE_THEMES[DEFAULT_THEME_NAME]
     apply_plotly_theme(theme)
+    if st.session_state.get("_brand_theme") is not theme:
+        st.session_state["_brand_theme"] = theme
+
     inject_global_styles(theme)
-    st.session_state["_brand_theme"] = theme
-    st.session_state["_brand_surface_tokens"] = _surface_tokens(theme)
     return theme
 
 
@@ -5,27 +5,34 @@ from pathlib import Path
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR / "src"))
+sys.path.append(str(ROOT_DIR))
 
 from revops import data
+from revops.analytics.utils import FilterSet
+
+# Loaded once per test process and shared by every module through the fixtures below.
+_MARKETING = data.get_marketing_df()
+_PIPELINE = data.get_pipeline_df()
+_REVENUE = data.get_revenue_df()
 
 
 @pytest.fixture(scope="session")
 def marketing_df():
-    return data.get_marketing_df().copy()
+    return _MARKETING
 
 
 @pytest.fixture(scope="session")
 def pipeline_df():
-    return data.get_pipeline_df().copy()
+    return _PIPELINE
 
 
 @pytest.fixture(scope="session")
 def revenue_df():
-    return data.get_revenue_df().copy()
+    return _REVENUE
 
 
-@pytest.fixture(autouse=True)
-def _clear_cache():
-    yield
-    data.clear_caches()
+@pytest.fixture(scope="session")
+def empty_filters():
+    return FilterSet()
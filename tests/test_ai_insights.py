@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+from operator import attrgetter
+
 from revops.ai.insights import generate_insights
-from revops.analytics.utils import FilterSet
 
 
-def test_generate_insights_returns_messages(marketing_df, pipeline_df, revenue_df):
+def test_generate_insights_returns_messages(marketing_df, pipeline_df, revenue_df, empty_filters):
     insights = generate_insights(
         marketing_df=marketing_df,
         pipeline_df=pipeline_df,
         revenue_df=revenue_df,
-        filters=FilterSet(),
+        filters=empty_filters,
     )
     assert len(insights) > 0
-    assert all(insight.message for insight in insights)
+    assert all(map(attrgetter("message"), insights))
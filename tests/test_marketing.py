@@ -8,8 +8,8 @@ from revops.analytics.marketing import channel_performance, marketing_kpis, tren
 from revops.analytics.utils import FilterSet
 
 
-def test_marketing_kpis_total_spend_positive(marketing_df):
-    kpis = marketing_kpis(marketing_df, FilterSet())
+def test_marketing_kpis_total_spend_positive(marketing_df, empty_filters):
+    kpis = marketing_kpis(marketing_df, empty_filters)
     assert kpis["total_spend"] > 0
     assert kpis["total_leads"] > 0
 
@@ -24,5 +24,5 @@ def test_channel_performance_respects_filters(marketing_df):
 def test_trend_timeseries_weekly_rollup(marketing_df):
     filters = FilterSet(start_date=date(2024, 1, 1), end_date=date(2024, 3, 31))
     trends = trend_timeseries(marketing_df, filters)
-    assert (trends["date"].diff().dropna().unique() >= pd.Timedelta(days=7)).all()
-    assert set(trends.columns) == {"date", "leads", "mqls", "sqls"}
+    assert pd.infer_freq(trends["date"]) == "W-SUN"
+    assert list(trends.columns) == ["date", "leads", "mqls", "sqls"]
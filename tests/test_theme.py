@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import replace
+from pathlib import Path
+
+import plotly.express as px
+import plotly.io as pio
+import pytest
+
+from streamlit_app import theme
+
+
+def _render(monkeypatch, brand_theme: theme.BrandTheme) -> str:
+    captured: list[str] = []
+    monkeypatch.setattr(theme.st, "markdown", lambda body, **_: captured.append(body))
+    theme.inject_global_styles(brand_theme)
+    return captured[0]
+
+
+_SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+_VIEWPORT_WIDTHS = (1400, 1100, 800, 500)
+_MEDIA_OR_RULE = re.compile(
+    r"@media\s*\(max-width:\s*(\d+)px\)\s*\{((?:[^{}]*\{[^{}]*\})*[^{}]*)\}|([^{}@]+)\{([^{}]*)\}"
+)
+_VAR_REF = re.compile(r"var\((--[\w-]+)(?:,\s*([^()]*))?\)")
+
+
+def _resolved_rules(css: str, width: int) -> dict[str, dict[str, str]]:
+    """Cascade the stylesheet at ``width`` into resolved declarations per selector."""
+
+    body = css.split("<style>", 1)[1].split("</style>", 1)[0]
+    active: list[tuple[str, str]] = []
+    for match in _MEDIA_OR_RULE.finditer(body):
+        max_width, media_body, selector_text, declarations = match.groups()
+        if max_width is None:
+            active.append((selector_text, declarations))
+        elif width <= int(max_width):
+            active.extend(re.findall(r"([^{}]+)\{([^{}]*)\}", media_body))
+
+    cascaded: dict[str, dict[str, str]] = {}
+    for selector_text, declarations in active:
+        for selector in selector_text.split(","):
+            target = cascaded.setdefault(" ".join(selector.split()), {})
+            for declaration in declarations.split(";"):
+                if ":" not in declaration:
+                    continue
+                name, value = (" ".join(part.split()) for part in declaration.split(":", 1))
+                if "!important" in target.get(name, "") and "!important" not in value:
+                    continue
+                target[name] = value
+
+    variables = {name: value for name, value in cascaded.get(":root", {}).items() if name.startswith("--")}
+
+    def resolve(value: str) -> str:
+        while _VAR_REF.search(value):
+            value = _VAR_REF.sub(lambda ref: variables.get(ref.group(1), ref.group(2) or ""), value)
+        return value
+
+    resolved = {}
+    for selector, declarations in cascaded.items():
+        properties = {name: resolve(value) for name, value in declarations.items() if not name.startswith("--")}
+        if properties:
+            resolved[selector] = dict(sorted(properties.items()))
+    return dict(sorted(resolved.items()))
+
+
+_FUNCTIONAL_PSEUDO = re.compile(r":(not|is|has|where)\(")
+
+
+def _specificity(selector: str) -> tuple[int, int, int]:
+    """Return the (id, class, type) specificity of a single complex selector."""
+
+    selector = re.sub(r"\"[^\"]*\"|'[^']*'", '""', selector)
+    ids = classes = types = 0
+    while match := _FUNCTIONAL_PSEUDO.search(selector):
+        depth, end = 1, match.end()
+        while depth:
+            depth += {"(": 1, ")": -1}.get(selector[end], 0)
+            end += 1
+        if match.group(1) != "where":
+            inner = max(_specificity(part) for part in selector[match.end() : end - 1].split(","))
+            ids, classes, types = ids + inner[0], classes + inner[1], types + inner[2]
+        selector = f"{selector[: match.start()]} {selector[end:]}"
+    ids += len(re.findall(r"#[\w-]+", selector))
+    classes += len(re.findall(r"\.[\w-]+|\[[^\]]*\]|(?<!:):[\w-]+", selector))
+    types += len(re.findall(r"::[\w-]+", selector))
+    types += len(re.findall(r"(?:^|[\s>+~])[a-zA-Z][\w-]*", selector))
+    return ids, classes, types
+
+
+def _cascade_order(css: str) -> dict[str, list[str]]:
+    """Source order of selectors per property and specificity, where more than one competes."""
+
+    body = css.split("<style>", 1)[1].split("</style>", 1)[0]
+    rules: list[tuple[str, str, str]] = []
+    for match in _MEDIA_OR_RULE.finditer(body):
+        max_width, media_body, selector_text, declarations = match.groups()
+        if max_width is None:
+            rules.append(("", selector_text, declarations))
+        else:
+            context = f"@media (max-width: {max_width}px) "
+            rules.extend((context, *rule) for rule in re.findall(r"([^{}]+)\{([^{}]*)\}", media_body))
+
+    order: dict[str, list[str]] = {}
+    for context, selector_text, declarations in rules:
+        for selector in selector_text.split(","):
+            selector = " ".join(selector.split())
+            specificity = ",".join(map(str, _specificity(selector)))
+            for declaration in declarations.split(";"):
+                name = declaration.split(":", 1)[0].strip()
+                if ":" in declaration and not name.startswith("--"):
+                    order.setdefault(f"{name} {specificity}", []).append(context + selector)
+    return {key: selectors for key, selectors in sorted(order.items()) if len(selectors) > 1}
+
+
+def _top_level_rules(css: str) -> list[tuple[tuple[str, ...], tuple[str, ...]]]:
+    css = re.sub(r"@media[^{]*\{(?:[^{}]*\{[^{}]*\})*[^{}]*\}", "", css)
+    rules = []
+    for selector_text, body in re.findall(r"([^{}]+)\{([^{}]*)\}", css):
+        selectors = tuple(" ".join(sel.split()) for sel in selector_text.split(","))
+        declarations = tuple(sorted(" ".join(decl.split()) for decl in body.split(";") if decl.strip()))
+        rules.append((selectors, declarations))
+    return rules
+
+
+@pytest.mark.parametrize("css", [theme._STATIC_CSS, theme._LIGHT_MODE_CSS])
+def test_stylesheet_has_no_duplicate_rules(css):
+    rules = _top_level_rules(css)
+    assert all(len(set(selectors)) == len(selectors) for selectors, _ in rules)
+    declaration_blocks = [declarations for _, declarations in rules]
+    assert len(set(declaration_blocks)) == len(declaration_blocks)
+
+
+@pytest.mark.parametrize("brand_theme", [theme.DARK_THEME, theme.LIGHT_THEME])
+def test_css_variables_are_declared(monkeypatch, brand_theme):
+    css = _render(monkeypatch, brand_theme)
+    declared = set(re.findall(r"--([\w-]+):", css))
+    referenced = set(re.findall(r"var\(--([\w-]+)\)", css))
+    assert referenced <= declared
+    assert "$" not in css
+
+
+def test_plotly_theme_rebuilds_for_derived_theme():
+    derived = replace(theme.DARK_THEME, accent_primary="#FF0000", colorway=("#FF0000",))
+    try:
+        theme.apply_plotly_theme(theme.DARK_THEME)
+        theme.apply_plotly_theme(derived)
+        assert list(pio.templates["revops-dark"].layout.colorway) == ["#FF0000"]
+        assert px.defaults.color_discrete_sequence == ["#FF0000"]
+    finally:
+        theme.apply_plotly_theme(theme.DARK_THEME)
+    assert list(pio.templates["revops-dark"].layout.colorway) == theme.DARK_THEME.colorway_list
+
+
+def test_derived_theme_renders_its_own_stylesheet(monkeypatch):
+    derived = replace(theme.DARK_THEME, accent_primary="#FF0000")
+    assert "#FF0000" in _render(monkeypatch, derived)
+    assert "#FF0000" not in _render(monkeypatch, theme.DARK_THEME)
+
+
+@pytest.mark.parametrize("brand_theme", [theme.DARK_THEME, theme.LIGHT_THEME])
+def test_resolved_stylesheet_matches_snapshot(monkeypatch, brand_theme):
+    """Pin each selector's resolved declarations; rule precedence is covered separately."""
+
+    css = _render(monkeypatch, brand_theme)
+    widest = _resolved_rules(css, _VIEWPORT_WIDTHS[0])
+    resolved = {str(_VIEWPORT_WIDTHS[0]): widest}
+    # Narrower viewports only record the selectors whose resolved declarations change.
+    for width in _VIEWPORT_WIDTHS[1:]:
+        rules = _resolved_rules(css, width)
+        resolved[str(width)] = {selector: body for selector, body in rules.items() if widest.get(selector) != body}
+    snapshot = _SNAPSHOT_DIR / f"theme_{brand_theme.key}.json"
+    # Regenerate after an intentional styling change with REVOPS_UPDATE_SNAPSHOTS=1.
+    if os.environ.get("REVOPS_UPDATE_SNAPSHOTS"):
+        snapshot.parent.mkdir(exist_ok=True)
+        snapshot.write_text(json.dumps(resolved, indent=1) + "\n")
+    assert resolved == json.loads(snapshot.read_text())
+
+
+@pytest.mark.parametrize("brand_theme", [theme.DARK_THEME, theme.LIGHT_THEME])
+def test_cascade_order_matches_snapshot(monkeypatch, brand_theme):
+    """Equal-specificity rules that set the same property must keep their source order."""
+
+    order = _cascade_order(_render(monkeypatch, brand_theme))
+    snapshot = _SNAPSHOT_DIR / f"theme_{brand_theme.key}_order.json"
+    if os.environ.get("REVOPS_UPDATE_SNAPSHOTS"):
+        snapshot.write_text(json.dumps(order, indent=1) + "\n")
+    assert order == json.loads(snapshot.read_text())